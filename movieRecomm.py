@@ -1,10 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 import requests
 from PIL import Image, ImageTk
 from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import webbrowser
+import itertools
 import json
+import math
+import csv
+import sys
 import os
 
 
@@ -62,6 +69,236 @@ class Movie:
         return movie
 
 
+class MovieLibraryIO:
+    """Клас для потокового імпорту та експорту бібліотеки фільмів (JSONL/CSV)."""
+    
+    FIELDS = ['movie_id', 'title', 'overview', 'poster_path', 'genre_names',
+              'release_date', 'vote_average', 'is_saved', 'is_watched']
+    GENRE_SEPARATOR = '|'
+    MAX_LOGGED_ERRORS = 5
+    
+    def __init__(self, batch_size=1000):
+        """
+        Ініціалізація з розміром пакета для злиття.
+        
+        Args:
+            batch_size (int): Кількість записів, що обробляються за один раз
+        """
+        self.batch_size = batch_size
+        self.skipped = 0
+    
+    def detect_format(self, path):
+        """Визначення формату файлу за розширенням ('jsonl' або 'csv')."""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in ('.jsonl', '.ndjson'):
+            return 'jsonl'
+        if extension == '.csv':
+            return 'csv'
+        raise ValueError(f"Непідтримуваний формат файлу: {extension or path}")
+    
+    def export_movies(self, movies, path, fmt=None):
+        """
+        Потоковий експорт фільмів у файл, по одному запису за раз.
+        
+        Args:
+            movies (iterable): Об'єкти Movie для експорту
+            path (str): Шлях до файлу
+            fmt (str): 'jsonl' або 'csv' (за замовчуванням - за розширенням)
+        
+        Returns:
+            int: Кількість записаних фільмів
+        """
+        fmt = fmt or self.detect_format(path)
+        temp_path = f"{path}.tmp"
+        count = 0
+        
+        # Пишемо у тимчасовий файл, щоб не зіпсувати існуючий експорт при помилці
+        try:
+            with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+                if fmt == 'csv':
+                    writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                    writer.writeheader()
+                    for movie in movies:
+                        row = movie.to_dict()
+                        row['genre_names'] = self.GENRE_SEPARATOR.join(row['genre_names'])
+                        row['poster_path'] = row['poster_path'] or ''
+                        writer.writerow(row)
+                        count += 1
+                else:
+                    for movie in movies:
+                        f.write(json.dumps(movie.to_dict(), ensure_ascii=False))
+                        f.write('\n')
+                        count += 1
+            
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        return count
+    
+    def iter_records(self, path, fmt=None):
+        """
+        Інкрементне читання та валідація записів з файлу.
+        
+        Некоректні записи пропускаються, їх кількість зберігається в self.skipped;
+        у консоль виводяться лише перші MAX_LOGGED_ERRORS помилок. Помилки
+        читання самого файлу (кодування, відсутні колонки CSV) переривають
+        читання винятком, щоб неповний імпорт не виглядав успішним.
+        
+        Args:
+            path (str): Шлях до файлу
+            fmt (str): 'jsonl' або 'csv' (за замовчуванням - за розширенням)
+        
+        Yields:
+            dict: Перевірений словник даних фільму
+        """
+        fmt = fmt or self.detect_format(path)
+        self.skipped = 0
+        
+        # utf-8-sig прибирає BOM, який додає Excel при збереженні CSV
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            if fmt == 'csv':
+                # Довгі описи фільмів - коректні дані, тому знімаємо стандартний ліміт поля
+                csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+                rows = csv.DictReader(f)
+                missing = {'movie_id', 'title'} - set(rows.fieldnames or [])
+                if missing:
+                    raise ValueError(f"У CSV відсутні колонки: {', '.join(sorted(missing))}")
+            else:
+                rows = f
+            
+            while True:
+                try:
+                    row = next(rows)
+                    if fmt != 'csv':
+                        if not row.strip():
+                            continue
+                        row = json.loads(row)
+                    record = self._validate_record(row)
+                except StopIteration:
+                    break
+                except UnicodeDecodeError:
+                    raise
+                except (ValueError, TypeError, KeyError, csv.Error) as e:
+                    self.skipped += 1
+                    if self.skipped <= self.MAX_LOGGED_ERRORS:
+                        print(f"Пропущено некоректний запис: {e}")
+                    continue
+                
+                yield record
+    
+    def merge_records(self, records, library, on_batch=None):
+        """
+        Пакетне злиття записів у бібліотеку з дедуплікацією за movie_id.
+        
+        Для наявних фільмів оновлюються дані, а позначки "збережено" та
+        "переглянуто" об'єднуються. Нові фільми без жодної позначки не
+        додаються, бо їх немає в жодному списку.
+        
+        Args:
+            records (iterable): Перевірені словники даних фільмів
+            library (dict): Словник {movie_id: Movie}, що оновлюється на місці
+            on_batch (callable): Викликається з кількістю оброблених записів
+        
+        Returns:
+            tuple: (кількість доданих, кількість оновлених, кількість без позначок)
+        """
+        added = updated = unflagged = processed = 0
+        records = iter(records)
+        
+        while True:
+            batch = list(itertools.islice(records, self.batch_size))
+            if not batch:
+                break
+            
+            for data in batch:
+                existing = library.get(data['movie_id'])
+                if existing is None:
+                    if not (data['is_saved'] or data['is_watched']):
+                        unflagged += 1
+                        continue
+                    library[data['movie_id']] = Movie.from_dict(data)
+                    added += 1
+                    continue
+                
+                existing.title = data['title']
+                existing.overview = data['overview']
+                existing.poster_path = data['poster_path']
+                existing.genre_names = data['genre_names']
+                existing.release_date = data['release_date']
+                existing.vote_average = data['vote_average']
+                existing.is_saved = existing.is_saved or data['is_saved']
+                existing.is_watched = existing.is_watched or data['is_watched']
+                updated += 1
+            
+            processed += len(batch)
+            if on_batch:
+                on_batch(processed)
+        
+        return added, updated, unflagged
+    
+    def _validate_record(self, raw):
+        """Перевірка та нормалізація одного запису (JSON-об'єкт або рядок CSV)."""
+        if not isinstance(raw, dict):
+            raise ValueError("запис не є об'єктом")
+        
+        movie_id = self._parse_movie_id(raw['movie_id'])
+        title = str(raw.get('title') or '').strip()
+        if not title:
+            raise ValueError(f"фільм {movie_id} не має назви")
+        
+        genre_names = raw.get('genre_names') or []
+        if isinstance(genre_names, str):
+            genre_names = [g for g in genre_names.split(self.GENRE_SEPARATOR) if g]
+        if not isinstance(genre_names, list):
+            raise ValueError(f"фільм {movie_id} має некоректні жанри")
+        
+        return {
+            'movie_id': movie_id,
+            'title': title,
+            'overview': str(raw.get('overview') or ''),
+            'poster_path': raw.get('poster_path') or None,
+            'genre_names': [str(g) for g in genre_names],
+            'release_date': str(raw.get('release_date') or ''),
+            'vote_average': self._parse_vote_average(raw.get('vote_average'), movie_id),
+            'is_saved': self._parse_bool(raw.get('is_saved')),
+            'is_watched': self._parse_bool(raw.get('is_watched'))
+        }
+    
+    @staticmethod
+    def _parse_movie_id(value):
+        """Перетворення movie_id у невід'ємне ціле без округлення дробових значень."""
+        if isinstance(value, bool):
+            raise ValueError(f"некоректний movie_id: {value!r}")
+        if isinstance(value, str) and value.strip().isdigit():
+            return int(value.strip())
+        if isinstance(value, int) and value >= 0:
+            return value
+        raise ValueError(f"некоректний movie_id: {value!r}")
+    
+    @staticmethod
+    def _parse_vote_average(value, movie_id):
+        """Перетворення оцінки у скінченне число в діапазоні 0-10."""
+        if value is None or value == '':
+            return 0.0
+        if isinstance(value, bool):
+            raise ValueError(f"фільм {movie_id} має некоректну оцінку: {value!r}")
+        
+        vote_average = float(value)
+        if not math.isfinite(vote_average) or not 0 <= vote_average <= 10:
+            raise ValueError(f"фільм {movie_id} має некоректну оцінку: {value!r}")
+        return vote_average
+    
+    @staticmethod
+    def _parse_bool(value):
+        """Перетворення значення з JSON або CSV у bool."""
+        if isinstance(value, str):
+            return value.strip().lower() in ('true', '1', 'yes')
+        return bool(value)
+
+
 class MovieDatabase:
     """Клас для роботи з The Movie Database API."""
     
@@ -70,7 +307,21 @@ class MovieDatabase:
         # Використовуємо публічний API ключ для демонстрації
         self.api_key = "your_api_key_here"  # Замініть на ваш API ключ
         self.base_url = "https://api.themoviedb.org/3"
-        self.image_base_url = "https://image.tmdb.org/t/p/w500"
+        self.image_base_url = "https://image.tmdb.org/t/p"
+        
+        # Доступні ширини постерів TMDB (від найменшої до найбільшої)
+        self.poster_widths = [92, 154, 185, 342, 500, 780]
+        
+        # Окремі LRU-кеші вже зменшених зображень: дрібні мініатюри карток і
+        # великі постери, щоб перегляд деталей не витісняв мініатюри.
+        # Доступ з фонових потоків, тому захищаємо їх блокуванням
+        self.thumbnail_cache = OrderedDict()
+        self.thumbnail_cache_limit = 1000
+        self.poster_cache = OrderedDict()
+        self.poster_cache_limit = 30
+        self.failed_posters = set()  # Лише остаточні помилки (наприклад, 404)
+        self.bytes_downloaded = 0
+        self.poster_lock = threading.Lock()
         
         # Словник жанрів з їх ID
         self.genres = {
@@ -189,12 +440,60 @@ class MovieDatabase:
         
         return None
     
-    def get_poster_image(self, poster_path):
+    def get_poster_variant(self, width):
+        """
+        Вибір найменшого варіанту постеру TMDB, що покриває потрібну ширину.
+        
+        Args:
+            width (int): Ширина віджета в пікселях
+            
+        Returns:
+            str: Назва варіанту (наприклад, 'w185' або 'original')
+        """
+        for poster_width in self.poster_widths:
+            if poster_width >= width:
+                return f"w{poster_width}"
+        return "original"
+    
+    def _get_poster_cache(self, variant):
+        """Вибір кешу та його ліміту для варіанту постеру."""
+        if variant == f"w{self.poster_widths[0]}":
+            return self.thumbnail_cache, self.thumbnail_cache_limit
+        return self.poster_cache, self.poster_cache_limit
+    
+    def get_cached_poster(self, poster_path, size, variant=None):
+        """
+        Отримання постеру з кешу без мережевого запиту.
+        
+        Args:
+            poster_path (str): Шлях до постеру
+            size (tuple): Розмір для відображення (ширина, висота)
+            variant (str): Варіант TMDB (за замовчуванням - за шириною)
+            
+        Returns:
+            PIL.Image: Зображення постеру або None, якщо його немає в кеші
+        """
+        variant = variant or self.get_poster_variant(size[0])
+        cache, _ = self._get_poster_cache(variant)
+        cache_key = (poster_path, variant, size)
+        
+        with self.poster_lock:
+            image = cache.get(cache_key)
+            if image is not None:
+                cache.move_to_end(cache_key)
+            return image
+    
+    def get_poster_image(self, poster_path, size=(200, 300), variant=None):
         """
-        Завантаження постеру фільму.
+        Завантаження постеру фільму у варіанті, що відповідає розміру.
+        
+        Метод блокує виконання на час запиту, тому з інтерфейсу його
+        викликають у фоновому потоці.
         
         Args:
             poster_path (str): Шлях до постеру
+            size (tuple): Розмір для відображення (ширина, висота)
+            variant (str): Варіант TMDB (за замовчуванням - за шириною)
             
         Returns:
             PIL.Image: Зображення постеру або None
@@ -202,18 +501,49 @@ class MovieDatabase:
         if not poster_path:
             return None
         
+        variant = variant or self.get_poster_variant(size[0])
+        cache_key = (poster_path, variant, size)
+        
+        image = self.get_cached_poster(poster_path, size, variant)
+        if image is not None:
+            return image
+        
+        with self.poster_lock:
+            if (poster_path, variant) in self.failed_posters:
+                return None
+        
         try:
-            url = f"{self.image_base_url}{poster_path}"
+            url = f"{self.image_base_url}/{variant}{poster_path}"
             response = requests.get(url, timeout=10)
             response.raise_for_status()
             
             image = Image.open(BytesIO(response.content))
-            image = image.resize((200, 300), Image.Resampling.LANCZOS)
-            return image
+            image = image.resize(size, Image.Resampling.LANCZOS)
             
-        except (requests.exceptions.RequestException, Exception) as e:
+        except requests.exceptions.RequestException as e:
             print(f"Помилка при завантаженні постеру: {e}")
+            # Запам'ятовуємо лише остаточні відмови сервера; після тайм-аутів
+            # та інших тимчасових помилок постер завантажиться наступного разу
+            status = e.response.status_code if e.response is not None else None
+            if status is not None and 400 <= status < 500 and status != 429:
+                with self.poster_lock:
+                    self.failed_posters.add((poster_path, variant))
             return None
+        except Exception as e:
+            # Пошкоджене зображення повторно завантажувати немає сенсу
+            print(f"Помилка при завантаженні постеру: {e}")
+            with self.poster_lock:
+                self.failed_posters.add((poster_path, variant))
+            return None
+        
+        cache, cache_limit = self._get_poster_cache(variant)
+        with self.poster_lock:
+            self.bytes_downloaded += len(response.content)
+            cache[cache_key] = image
+            if len(cache) > cache_limit:
+                cache.popitem(last=False)
+        
+        return image
 
 
 class MovieRecommendationApp:
@@ -228,9 +558,26 @@ class MovieRecommendationApp:
         
         # Ініціалізація компонентів
         self.movie_db = MovieDatabase()
+        self.library_io = MovieLibraryIO()
+        self.poster_size = (200, 300)
+        self.thumbnail_size = (60, 90)
+        
+        # Постери завантажуються у фонових потоках, щоб не блокувати інтерфейс
+        self.image_executor = ThreadPoolExecutor(max_workers=4)
+        self.pending_images = {}
+        self.blank_thumbnail = tk.PhotoImage(width=self.thumbnail_size[0], 
+                                             height=self.thumbnail_size[1])
         self.saved_movies = []
         self.watched_movies = []
         self.current_movies = []
+        self.data_file = 'movie_data.jsonl'
+        self.legacy_data_file = 'movie_data.json'
+        self.import_running = False
+        
+        # Картки у вкладках показуються сторінками, щоб великі бібліотеки
+        # не створювали тисячі віджетів і завантажень мініатюр одразу
+        self.cards_page_size = 30
+        self.visible_cards = {'saved': self.cards_page_size, 'watched': self.cards_page_size}
         
         # Завантаження збережених даних
         self.load_data()
@@ -243,6 +590,14 @@ class MovieRecommendationApp:
     
     def create_widgets(self):
         """Створення всіх віджетів інтерфейсу."""
+        # Меню імпорту/експорту бібліотеки
+        self.menu_bar = tk.Menu(self.root)
+        library_menu = tk.Menu(self.menu_bar, tearoff=0)
+        library_menu.add_command(label="Імпортувати...", command=self.import_library)
+        library_menu.add_command(label="Експортувати...", command=self.export_library)
+        self.menu_bar.add_cascade(label="Бібліотека", menu=library_menu)
+        self.root.config(menu=self.menu_bar)
+        
         # Заголовок
         title_frame = tk.Frame(self.root, bg='#2c3e50')
         title_frame.pack(pady=20)
@@ -252,6 +607,12 @@ class MovieRecommendationApp:
                               fg='#ecf0f1', bg='#2c3e50')
         title_label.pack()
         
+        # Рядок стану з трафіком зображень за сесію
+        self.bandwidth_label = tk.Label(self.root, font=('Arial', 10), 
+                                        fg='#bdc3c7', bg='#2c3e50')
+        self.bandwidth_label.pack(side=tk.BOTTOM, anchor=tk.E, padx=20, pady=5)
+        self.update_bandwidth_label()
+        
         # Notebook для вкладок
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(expand=True, fill='both', padx=20, pady=10)
@@ -506,15 +867,82 @@ class MovieRecommendationApp:
     
     def load_poster(self, movie, parent_frame):
         """Завантаження та відображення постеру фільму."""
-        try:
-            poster_image = self.movie_db.get_poster_image(movie.poster_path)
-            if poster_image:
-                poster_photo = ImageTk.PhotoImage(poster_image)
-                poster_label = tk.Label(parent_frame, image=poster_photo, bg='#2c3e50')
-                poster_label.image = poster_photo  # Зберігаємо посилання
-                poster_label.pack(pady=10)
-        except Exception as e:
-            print(f"Помилка завантаження постеру: {e}")
+        poster_label = tk.Label(parent_frame, bg='#2c3e50')
+        poster_label.pack(pady=10)
+        
+        poster_image = self.movie_db.get_cached_poster(movie.poster_path, self.poster_size)
+        if poster_image:
+            self.set_label_image(poster_label, poster_image)
+            return
+        
+        poster_label.is_sharp = False
+        
+        def show_placeholder(thumbnail):
+            # Чіткий постер міг прийти раніше за мініатюру
+            if not poster_label.is_sharp:
+                placeholder = thumbnail.resize(self.poster_size, Image.Resampling.BILINEAR)
+                self.set_label_image(poster_label, placeholder)
+        
+        def show_sharp(image):
+            poster_label.is_sharp = True
+            self.set_label_image(poster_label, image)
+        
+        # Спочатку показуємо збільшену мініатюру w92, потім підміняємо її чітким постером
+        thumbnail = self.movie_db.get_cached_poster(movie.poster_path, self.thumbnail_size)
+        if thumbnail:
+            show_placeholder(thumbnail)
+        else:
+            self.load_image_async(poster_label, movie.poster_path, 
+                                  self.thumbnail_size, show_placeholder)
+        
+        self.load_image_async(poster_label, movie.poster_path, 
+                              self.poster_size, show_sharp)
+    
+    def load_image_async(self, widget, poster_path, size, callback):
+        """
+        Завантаження постеру у фоновому потоці.
+        
+        Повторні запити того самого зображення, поки воно ще завантажується,
+        не створюють нового завантаження, а чекають на вже запущене.
+        
+        Args:
+            widget (tk.Widget): Віджет, для якого завантажується зображення
+            poster_path (str): Шлях до постеру
+            size (tuple): Розмір для відображення (ширина, висота)
+            callback (callable): Викликається в потоці Tk із завантаженим PIL.Image
+        """
+        pending_key = (poster_path, size)
+        if pending_key in self.pending_images:
+            self.pending_images[pending_key].append((widget, callback))
+            return
+        self.pending_images[pending_key] = [(widget, callback)]
+        
+        def deliver(image):
+            for waiting_widget, waiting_callback in self.pending_images.pop(pending_key, []):
+                # Віджет могли знищити, поки йшло завантаження (наприклад, при оновленні списку)
+                if image is not None and waiting_widget.winfo_exists():
+                    waiting_callback(image)
+            self.update_bandwidth_label()
+        
+        def worker():
+            image = self.movie_db.get_poster_image(poster_path, size)
+            try:
+                self.root.after(0, deliver, image)
+            except (RuntimeError, tk.TclError):
+                pass  # Вікно вже закрито
+        
+        self.image_executor.submit(worker)
+    
+    def set_label_image(self, label, image):
+        """Встановлення зображення PIL у мітку."""
+        photo = ImageTk.PhotoImage(image)
+        label.configure(image=photo)
+        label.image = photo  # Зберігаємо посилання
+    
+    def update_bandwidth_label(self):
+        """Оновлення рядка стану з обсягом завантажених зображень."""
+        kilobytes = self.movie_db.bytes_downloaded / 1024
+        self.bandwidth_label.configure(text=f"Трафік зображень за сесію: {kilobytes:.1f} КБ")
     
     def watch_trailer(self, movie):
         """Відкриття трейлера фільму."""
@@ -576,8 +1004,8 @@ class MovieRecommendationApp:
                                      font=('Arial', 16), fg='#bdc3c7', bg='#34495e')
             no_saved_label.pack(expand=True, pady=50)
         else:
-            for movie in self.saved_movies:
-                self.create_movie_card(movie, self.saved_scrollable_frame)
+            self.create_movie_cards(self.saved_movies, self.saved_scrollable_frame, 
+                                    'saved', self.update_saved_movies_display)
     
     def update_watched_movies_display(self):
         """Оновлення відображення переглянутих фільмів."""
@@ -591,14 +1019,53 @@ class MovieRecommendationApp:
                                        font=('Arial', 16), fg='#bdc3c7', bg='#34495e')
             no_watched_label.pack(expand=True, pady=50)
         else:
-            for movie in self.watched_movies:
-                self.create_movie_card(movie, self.watched_scrollable_frame)
+            self.create_movie_cards(self.watched_movies, self.watched_scrollable_frame, 
+                                    'watched', self.update_watched_movies_display)
+    
+    def create_movie_cards(self, movies, parent, list_name, refresh):
+        """
+        Створення карток для показаних сторінок списку з кнопкою "Показати ще".
+        
+        Args:
+            movies (list): Список фільмів вкладки
+            parent (tk.Frame): Фрейм для карток
+            list_name (str): 'saved' або 'watched'
+            refresh (callable): Функція перебудови вкладки
+        """
+        visible = self.visible_cards[list_name]
+        for movie in itertools.islice(movies, visible):
+            self.create_movie_card(movie, parent)
+        
+        if len(movies) > visible:
+            more_btn = tk.Button(parent, text=f"Показати ще (залишилось {len(movies) - visible})", 
+                                 font=('Arial', 10),
+                                 bg='#3498db', fg='white',
+                                 command=lambda: self.show_more_cards(list_name, refresh))
+            more_btn.pack(pady=10)
+    
+    def show_more_cards(self, list_name, refresh):
+        """Показ наступної сторінки карток у вкладці."""
+        self.visible_cards[list_name] += self.cards_page_size
+        refresh()
     
     def create_movie_card(self, movie, parent):
         """Створення картки фільму."""
         card_frame = tk.Frame(parent, bg='#2c3e50', relief=tk.RAISED, bd=2)
         card_frame.pack(fill=tk.X, padx=10, pady=5)
         
+        # Мініатюра постеру (порожня, поки не завантажиться у фоні)
+        if movie.poster_path:
+            thumb_label = tk.Label(card_frame, image=self.blank_thumbnail, bg='#2c3e50')
+            thumb_label.pack(side=tk.LEFT, padx=10, pady=5)
+            
+            thumbnail = self.movie_db.get_cached_poster(movie.poster_path, self.thumbnail_size)
+            if thumbnail:
+                self.set_label_image(thumb_label, thumbnail)
+            else:
+                self.load_image_async(
+                    thumb_label, movie.poster_path, self.thumbnail_size,
+                    lambda image, label=thumb_label: self.set_label_image(label, image))
+        
         # Назва фільму
         title_label = tk.Label(card_frame, text=movie.title, 
                               font=('Arial', 14, 'bold'), 
@@ -626,25 +1093,36 @@ class MovieRecommendationApp:
         self.notebook.tab(2, text=f"Переглянуті ({len(self.watched_movies)})")
     
     def save_data(self):
-        """Збереження даних у файл."""
-        data = {
-            'saved_movies': [movie.to_dict() for movie in self.saved_movies],
-            'watched_movies': [movie.to_dict() for movie in self.watched_movies]
-        }
-        
+        """Потокове збереження даних у файл JSONL (один запис на фільм)."""
         try:
-            with open('movie_data.json', 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.library_io.export_movies(self.iter_library_movies(), self.data_file, 'jsonl')
         except Exception as e:
             print(f"Помилка збереження даних: {e}")
     
     def load_data(self):
-        """Завантаження збережених даних з файлу."""
-        if not os.path.exists('movie_data.json'):
+        """Потокове завантаження збережених даних з файлу."""
+        if not os.path.exists(self.data_file):
+            self.load_legacy_data()
+            return
+        
+        try:
+            library = {}
+            self.library_io.merge_records(
+                self.library_io.iter_records(self.data_file, 'jsonl'), library)
+            
+            # Один спільний об'єкт на фільм в обох списках
+            self.saved_movies = [m for m in library.values() if m.is_saved]
+            self.watched_movies = [m for m in library.values() if m.is_watched]
+        except Exception as e:
+            print(f"Помилка завантаження даних: {e}")
+    
+    def load_legacy_data(self):
+        """Одноразове завантаження даних зі старого формату movie_data.json."""
+        if not os.path.exists(self.legacy_data_file):
             return
         
         try:
-            with open('movie_data.json', 'r', encoding='utf-8') as f:
+            with open(self.legacy_data_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
             self.saved_movies = [Movie.from_dict(movie_data) 
@@ -654,9 +1132,108 @@ class MovieRecommendationApp:
         except Exception as e:
             print(f"Помилка завантаження даних: {e}")
     
+    def iter_library_movies(self):
+        """
+        Перебір унікальних фільмів зі збережених та переглянутих (за movie_id).
+        
+        Позначки "збережено" та "переглянуто" виставляються за належністю до
+        списків, бо один фільм може бути представлений різними об'єктами.
+        """
+        saved_ids = {m.movie_id for m in self.saved_movies}
+        watched_ids = {m.movie_id for m in self.watched_movies}
+        seen_ids = set()
+        for movie in itertools.chain(self.saved_movies, self.watched_movies):
+            if movie.movie_id not in seen_ids:
+                seen_ids.add(movie.movie_id)
+                movie.is_saved = movie.movie_id in saved_ids
+                movie.is_watched = movie.movie_id in watched_ids
+                yield movie
+    
+    def export_library(self):
+        """Експорт бібліотеки у файл JSONL або CSV."""
+        path = filedialog.asksaveasfilename(
+            defaultextension='.jsonl',
+            filetypes=[("JSON Lines", "*.jsonl"), ("CSV", "*.csv")])
+        if not path:
+            return
+        
+        try:
+            count = self.library_io.export_movies(self.iter_library_movies(), path)
+            messagebox.showinfo("Експорт", f"Експортовано фільмів: {count}")
+        except Exception as e:
+            messagebox.showerror("Помилка", f"Помилка експорту: {e}")
+    
+    def import_library(self):
+        """Імпорт бібліотеки з файлу JSONL або CSV зі злиттям за movie_id."""
+        path = filedialog.askopenfilename(
+            filetypes=[("JSON Lines", "*.jsonl *.ndjson"), ("CSV", "*.csv")])
+        if not path:
+            return
+        
+        # Індекс з копій поточної бібліотеки; один об'єкт на movie_id.
+        # Злиття йде в копії, тож при помилці поточні списки залишаються незмінними
+        library = {}
+        for movie in self.iter_library_movies():
+            library[movie.movie_id] = Movie.from_dict(movie.to_dict())
+        
+        # Модальне вікно прогресу: поки під час злиття обробляються події Tk,
+        # воно перехоплює введення, тож списки не можна змінити
+        progress_window = tk.Toplevel(self.root)
+        progress_window.title("Імпорт")
+        progress_window.configure(bg='#2c3e50')
+        progress_window.transient(self.root)
+        progress_window.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        progress_label = tk.Label(progress_window, text="Імпорт бібліотеки...", 
+                                  font=('Arial', 12), fg='#ecf0f1', bg='#2c3e50')
+        progress_label.pack(padx=30, pady=20)
+        
+        def on_batch(processed):
+            progress_label.configure(text=f"Оброблено записів: {processed}")
+            self.root.update()
+        
+        self.import_running = True
+        self.menu_bar.entryconfig("Бібліотека", state='disabled')
+        error = None
+        try:
+            progress_window.wait_visibility()
+            progress_window.grab_set()
+            records = self.library_io.iter_records(path)
+            added, updated, unflagged = self.library_io.merge_records(
+                records, library, on_batch=on_batch)
+        except Exception as e:
+            error = e
+        finally:
+            self.import_running = False
+            self.menu_bar.entryconfig("Бібліотека", state='normal')
+            progress_window.grab_release()
+            progress_window.destroy()
+        
+        if error:
+            messagebox.showerror("Помилка", f"Помилка імпорту: {error}")
+            return
+        
+        self.saved_movies = [m for m in library.values() if m.is_saved]
+        self.watched_movies = [m for m in library.values() if m.is_watched]
+        
+        self.update_saved_movies_display()
+        self.update_watched_movies_display()
+        self.update_tab_counts()
+        self.save_data()
+        
+        messagebox.showinfo("Імпорт", 
+                            f"Додано: {added}\nОновлено: {updated}\n"
+                            f"Пропущено без позначок: {unflagged}\n"
+                            f"Пропущено некоректних: {self.library_io.skipped}")
+    
     def on_closing(self):
         """Обробка закриття програми."""
+        # Під час імпорту бібліотека ще не узгоджена, тому закриття ігноруємо
+        if self.import_running:
+            return
+        
         self.save_data()
+        self.image_executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def run(self):